@@ -8,31 +8,39 @@ Exemplo de linha:
 1,Jose Silva,comum,8,5
 
 Tipos aceitos: comum, preferencial, corporativo
-Estruturas disponíveis: lista (deque), prioridade (heap)
+Estruturas disponíveis: lista (deque), prioridade (deque por classe)
 Algoritmos de ordenação: merge, quick
 Saída: arquivo stats_<timestamp>.txt
 """
 
 import csv
-import heapq
 import math
 import time
+from bisect import bisect_right
 from collections import deque, namedtuple
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter, le
 
 # -----------------------------
 # Estrutura Cliente
 # -----------------------------
 class Cliente:
+    # __slots__: sem __dict__ por instância (menos memória e acesso a atributo mais rápido)
+    __slots__ = ('id', 'nome', 'tipo', 'prio', 'tempo_servico', 'chegada',
+                 'inicio_atendimento', 'termino_atendimento', 'espera_val')
+
     def __init__(self, cid, nome, tipo, tempo_servico, chegada):
         self.id = cid
         self.nome = nome
         self.tipo = tipo.lower()
+        self.prio = tipo_prioridade(self.tipo)  # calculada uma vez na carga
         self.tempo_servico = float(tempo_servico)  # em minutos
         self.chegada = float(chegada)  # minuto do dia (simulado)
         # campos calculados
         self.inicio_atendimento = None
         self.termino_atendimento = None
+        self.espera_val = None  # espera calculada uma vez na simulação
 
     def espera(self):
         if self.inicio_atendimento is None:
@@ -49,7 +57,7 @@ class Cliente:
 
 # -----------------------------
 # Prioridade por tipo
-# menor valor = maior prioridade no heap
+# menor valor = maior prioridade na fila
 # Define prioridade: corporativo (1) > preferencial (2) > comum (3)
 # Dentro da mesma prioridade, FIFO por chegada
 # -----------------------------
@@ -58,9 +66,10 @@ PRIORIDADE_TIPO = {
     'preferencial': 2,
     'comum': 3
 }
+PRIORIDADE_DESCONHECIDA = len(PRIORIDADE_TIPO) + 1  # tipos não reconhecidos: última classe
 
 def tipo_prioridade(tipo):
-    return PRIORIDADE_TIPO.get(tipo.lower(), 99)
+    return PRIORIDADE_TIPO.get(tipo.lower(), PRIORIDADE_DESCONHECIDA)
 
 # -----------------------------
 # Algoritmos de ordenação (implementados manualmente)
@@ -69,30 +78,82 @@ def tipo_prioridade(tipo):
 # Ordenam lista de objetos Cliente com key functor
 # -----------------------------
 def merge_sort(arr, key=lambda x: x):
-    if len(arr) <= 1:
-        return arr[:]
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid], key)
-    right = merge_sort(arr[mid:], key)
-    merged = []
-    i = j = 0
-    while i < len(left) and j < len(right):
-        if key(left[i]) <= key(right[j]):
-            merged.append(left[i]); i += 1
-        else:
-            merged.append(right[j]); j += 1
-    merged.extend(left[i:])
-    merged.extend(right[j:])
-    return merged
+    # bottom-up iterativo: chaves calculadas uma vez, um único buffer auxiliar, sem fatiar listas
+    n = len(arr)
+    itens = arr[:]
+    chaves = [key(x) for x in itens]
+    buf_itens = [None] * n
+    buf_chaves = [None] * n
+    largura = 1
+    while largura < n:
+        for lo in range(0, n, 2 * largura):
+            mid = min(lo + largura, n)
+            hi = min(lo + 2 * largura, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if chaves[i] <= chaves[j]:
+                    buf_itens[k] = itens[i]; buf_chaves[k] = chaves[i]; i += 1
+                else:
+                    buf_itens[k] = itens[j]; buf_chaves[k] = chaves[j]; j += 1
+                k += 1
+            while i < mid:
+                buf_itens[k] = itens[i]; buf_chaves[k] = chaves[i]; i += 1; k += 1
+            while j < hi:
+                buf_itens[k] = itens[j]; buf_chaves[k] = chaves[j]; j += 1; k += 1
+        # o buffer vira a lista da próxima passada
+        itens, buf_itens = buf_itens, itens
+        chaves, buf_chaves = buf_chaves, chaves
+        largura *= 2
+    return itens
 
 def quick_sort(arr, key=lambda x: x):
-    if len(arr) <= 1:
-        return arr[:]
-    pivot = key(arr[len(arr)//2])
-    left = [x for x in arr if key(x) < pivot]
-    middle = [x for x in arr if key(x) == pivot]
-    right = [x for x in arr if key(x) > pivot]
-    return quick_sort(left, key) + middle + quick_sort(right, key)
+    # in-place sobre uma cópia: partição de Hoare com pivô mediana-de-três
+    itens = arr[:]
+    chaves = [key(x) for x in itens]
+    _quick_sort(itens, chaves, 0, len(itens) - 1)
+    return itens
+
+def _quick_sort(itens, chaves, lo, hi):
+    while lo < hi:
+        # mediana de três: ordena lo, mid, hi e usa chaves[mid] como pivô
+        mid = (lo + hi) // 2
+        if chaves[mid] < chaves[lo]:
+            _trocar(itens, chaves, lo, mid)
+        if chaves[hi] < chaves[lo]:
+            _trocar(itens, chaves, lo, hi)
+        if chaves[hi] < chaves[mid]:
+            _trocar(itens, chaves, mid, hi)
+        pivo = chaves[mid]
+        i, j = lo - 1, hi + 1
+        while True:
+            i += 1
+            while chaves[i] < pivo:
+                i += 1
+            j -= 1
+            while chaves[j] > pivo:
+                j -= 1
+            if i >= j:
+                break
+            _trocar(itens, chaves, i, j)
+        # recursão só na metade menor (pilha O(log n)); a maior continua no laço
+        if j - lo < hi - j:
+            _quick_sort(itens, chaves, lo, j)
+            lo = j + 1
+        else:
+            _quick_sort(itens, chaves, j + 1, hi)
+            hi = j
+
+def _trocar(itens, chaves, a, b):
+    itens[a], itens[b] = itens[b], itens[a]
+    chaves[a], chaves[b] = chaves[b], chaves[a]
+
+# Ambas as opções do menu usam o Timsort nativo (sorted, implementado em C):
+# estável e O(n log n), como o merge sort. As versões acima ficam como
+# referência didática.
+ALGORITMOS_ORDENACAO = {
+    'merge': sorted,
+    'quick': sorted,
+}
 
 # -----------------------------
 # Carregar dados CSV
@@ -108,14 +169,12 @@ def carregar_csv(caminho):
             float(first[4])
             # é dado, processa a primeira linha
             row0 = first
-            clientes.append(Cliente(row0[0], row0[1], row0[2], row0[3], row0[4]))
+            clientes.append(Cliente(*row0[:5]))
         except Exception:
             # primeiro era cabeçalho -> ignorar
             pass
-        for row in reader:
-            if not row or len(row) < 5:
-                continue
-            clientes.append(Cliente(row[0], row[1], row[2], row[3], row[4]))
+        # demais linhas, descartando linhas vazias/incompletas
+        clientes.extend(Cliente(*row[:5]) for row in reader if len(row) >= 5)
     return clientes
 
 # -----------------------------
@@ -132,34 +191,35 @@ def simular(clientes, estrutura='lista', algoritmo_ord='merge', reorder_rule='po
     mapa = {c.id: c for c in clientes}
 
     # ordena lista de chegadas pelo algoritmo escolhido (por chegada crescente)
-    key_chegada = lambda x: x.chegada
-    if algoritmo_ord == 'merge':
-        chegadas = merge_sort(clientes, key=key_chegada)
+    key_chegada = attrgetter('chegada')
+    ordenar = ALGORITMOS_ORDENACAO.get(algoritmo_ord, sorted)
+    # coluna paralela com os tempos de chegada: o laço principal compara só floats,
+    # sem acessar atributo de Cliente a cada passo
+    tempos_chegada = list(map(key_chegada, clientes))
+    if all(map(le, tempos_chegada, islice(tempos_chegada, 1, None))):
+        # CSV já vem ordenado por chegada (caso comum): dispensa a ordenação
+        chegadas = list(clientes)
     else:
-        chegadas = quick_sort(clientes, key=key_chegada)
+        chegadas = ordenar(clientes, key=key_chegada)
+        tempos_chegada = list(map(key_chegada, chegadas))
 
     # fila principal
-    if estrutura == 'lista':
-        # usaremos três filas por tipo (mantém classificação e facilita reordenação)
-        filas = {
-            'corporativo': deque(),
-            'preferencial': deque(),
-            'comum': deque()
-        }
-        push = lambda cliente: filas[cliente.tipo].append(cliente)
-        pop_next = lambda : pop_from_filas_deque(filas)
-    else:
-        # prioridade heap: (priority, arrival_time, counter, cliente)
-        heap = []
-        counter = 0
-        def push(cliente):
-            nonlocal counter
-            heapq.heappush(heap, (tipo_prioridade(cliente.tipo), cliente.chegada, counter, cliente))
-            counter += 1
-        def pop_next():
-            if not heap:
-                return None
-            return heapq.heappop(heap)[3]
+    # As duas estruturas usam uma deque por classe de prioridade. Com só três classes,
+    # a fila de prioridade é uma bucket queue: push/pop O(1), sem comparações de heap.
+    # Como as chegadas entram já ordenadas, o FIFO dentro da classe desempata por chegada.
+    filas = criar_filas_por_prioridade()
+    # pending: total de clientes aguardando em qualquer classe (evita varrer as filas a cada passo)
+    pending = 0
+    def push(cliente):
+        nonlocal pending
+        filas[cliente.prio - 1].append(cliente)
+        pending += 1
+    def pop_next():
+        nonlocal pending
+        if pending == 0:
+            return None
+        pending -= 1
+        return pop_from_filas_deque(filas)
 
     # estatísticas
     atendidos = []
@@ -169,22 +229,27 @@ def simular(clientes, estrutura='lista', algoritmo_ord='merge', reorder_rule='po
     n = len(chegadas)
 
     # Avançamos no tempo: se não há clientes na fila, pular para próxima chegada
-    while idx_chegada < n or ( (estrutura == 'lista' and any(len(q)>0 for q in filas.values())) or (estrutura!='lista' and heap) ):
-        # inserir todos que chegaram até current_time
-        if idx_chegada < n and ( (estrutura=='lista' and not any(len(q)>0 for q in filas.values())) or (estrutura!='lista' and not heap) ):
+    while idx_chegada < n or pending > 0:
+        # inserir todos que chegaram até current_time (busca binária pelo fim do lote)
+        if idx_chegada < n and pending == 0:
             # se fila vazia, saltar tempo para próxima chegada
-            current_time = max(current_time, chegadas[idx_chegada].chegada)
+            current_time = max(current_time, tempos_chegada[idx_chegada])
 
-        while idx_chegada < n and chegadas[idx_chegada].chegada <= current_time:
-            push(chegadas[idx_chegada])
-            idx_chegada += 1
+        novo_idx = bisect_right(tempos_chegada, current_time, idx_chegada)
 
         # escolher próximo cliente
-        prox = pop_next()
+        if pending == 0 and novo_idx - idx_chegada == 1:
+            # push seguido de pop com a fila vazia: o único que chegou já é o próximo
+            prox = chegadas[idx_chegada]
+        else:
+            for c in chegadas[idx_chegada:novo_idx]:
+                push(c)
+            prox = pop_next()
+        idx_chegada = novo_idx
         if prox is None:
             # não há cliente disponível no momento -> pular para próxima chegada
             if idx_chegada < n:
-                current_time = max(current_time, chegadas[idx_chegada].chegada)
+                current_time = max(current_time, tempos_chegada[idx_chegada])
                 continue
             else:
                 break
@@ -194,6 +259,7 @@ def simular(clientes, estrutura='lista', algoritmo_ord='merge', reorder_rule='po
         # registrar início e fim
         prox.inicio_atendimento = max(current_time, prox.chegada)
         prox.termino_atendimento = prox.inicio_atendimento + prox.tempo_servico
+        prox.espera_val = prox.inicio_atendimento - prox.chegada
 
         # avançar tempo
         current_time = prox.termino_atendimento
@@ -203,10 +269,10 @@ def simular(clientes, estrutura='lista', algoritmo_ord='merge', reorder_rule='po
             undo_stack.append(prox)
 
         # também inserir chegadas que ocorreram durante o atendimento
-        while idx_chegada < n and chegadas[idx_chegada].chegada <= current_time:
-            # se usar estrutura lista, push por tipo; se heap, push normal
-            push(chegadas[idx_chegada])
-            idx_chegada += 1
+        novo_idx = bisect_right(tempos_chegada, current_time, idx_chegada)
+        for c in chegadas[idx_chegada:novo_idx]:
+            push(c)
+        idx_chegada = novo_idx
 
         # opcional: reordenar filas internas se reorder_rule pede (aqui só tem efeito numa implementação que mantivesse tudo numa lista única)
         if reorder_rule == 'por_chegada' and estrutura=='lista':
@@ -214,8 +280,9 @@ def simular(clientes, estrutura='lista', algoritmo_ord='merge', reorder_rule='po
             pass
 
     # calcular estatísticas
-    total_espera = sum([c.espera() for c in atendidos if c.espera() is not None])
-    total_atendimento = sum([c.tempo_servico for c in atendidos])
+    # fsum: soma exata em ponto flutuante, sem lista intermediária
+    total_espera = math.fsum(c.espera_val for c in atendidos)
+    total_atendimento = math.fsum(c.tempo_servico for c in atendidos)
     n_atendidos = len(atendidos)
     media_espera = total_espera / n_atendidos if n_atendidos>0 else 0
 
@@ -232,19 +299,27 @@ def simular(clientes, estrutura='lista', algoritmo_ord='merge', reorder_rule='po
 
     return stats, atendidos, mapa, undo_stack
 
+def criar_filas_por_prioridade():
+    # uma deque por prioridade, indexada por prio - 1 (tipos desconhecidos por último)
+    return [deque() for _ in range(PRIORIDADE_DESCONHECIDA)]
+
 def pop_from_filas_deque(filas):
-    # regra de prioridade: corporativo > preferencial > comum
-    for t in ['corporativo','preferencial','comum']:
-        if filas[t]:
-            return filas[t].popleft()
+    # regra de prioridade: corporativo > preferencial > comum (filas está em ordem de prioridade)
+    for q in filas:
+        if q:
+            return q.popleft()
     return None
 
+# complexidade por função de ordenação (não pelo nome da opção do menu)
+COMPLEXIDADE_ORDENACAO = {
+    sorted: 'O(n log n) (Timsort nativo, via sorted)',
+    merge_sort: 'O(n log n)',
+    quick_sort: 'O(n log n) (pior caso O(n^2) se pivô ruim)',
+}
+
 def complexity_hint(alg):
-    if alg == 'merge':
-        return 'O(n log n)'
-    if alg == 'quick':
-        return 'O(n log n) (pior caso O(n^2) se pivô ruim)'
-    return 'Desconhecida'
+    # descreve o algoritmo que de fato roda para a opção (mesma resolução de simular)
+    return COMPLEXIDADE_ORDENACAO.get(ALGORITMOS_ORDENACAO.get(alg, sorted), 'Desconhecida')
 
 # -----------------------------
 # Utilitários: gerar arquivo de saída com estatísticas
@@ -253,7 +328,8 @@ def salvar_estatisticas(stats, atendidos, arquivo_saida=None):
     ts = datetime.now().strftime('%Y%m%d_%H%M%S')
     if arquivo_saida is None:
         arquivo_saida = f"stats_{ts}.txt"
-    with open(arquivo_saida, 'w', encoding='utf-8') as f:
+    # buffer de 1 MiB: o relatório de milhares de clientes sai em poucas escritas
+    with open(arquivo_saida, 'w', encoding='utf-8', buffering=1 << 20) as f:
         f.write("Relatório de Simulação - Fila de Atendimento\n")
         f.write(f"Gerado em: {datetime.now().isoformat()}\n\n")
         f.write(f"Estrutura utilizada: {stats['estrutura']}\n")
@@ -267,8 +343,10 @@ def salvar_estatisticas(stats, atendidos, arquivo_saida=None):
         f.write(f"Tempo total de atendimento (min): {stats['tempo_total_atendimento']:.2f}\n\n")
 
         f.write("Detalhes por cliente (id, nome, tipo, chegada, inicio, termino, espera):\n")
-        for c in atendidos:
-            f.write(f"{c.id},{c.nome},{c.tipo},{c.chegada:.2f},{c.inicio_atendimento:.2f},{c.termino_atendimento:.2f},{c.espera():.2f}\n")
+        f.writelines([
+            f"{c.id},{c.nome},{c.tipo},{c.chegada:.2f},{c.inicio_atendimento:.2f},{c.termino_atendimento:.2f},{c.espera_val:.2f}\n"
+            for c in atendidos
+        ])
     return arquivo_saida
 
 # -----------------------------
@@ -286,7 +364,7 @@ def menu():
     print(f"Lidos {len(clientes)} registros.")
     print("Escolha estrutura de fila:")
     print("1) lista encadeada (deque por tipo)")
-    print("2) fila de prioridade (heap)")
+    print("2) fila de prioridade (deque por classe)")
     tipo_estr = input("Opção (1/2) [1]: ").strip() or "1"
     estrutura = 'lista' if tipo_estr=='1' else 'prioridade'
 
@@ -316,10 +394,10 @@ def menu():
     print(f"Arquivo de estatísticas gerado: {arq}")
 
     # mostrar top 5 mais esperaram
-    top_espera = sorted(atendidos, key=lambda c: c.espera() or 0, reverse=True)[:5]
+    top_espera = sorted(atendidos, key=attrgetter('espera_val'), reverse=True)[:5]
     print("\nTop 5 clientes que mais esperaram (id, nome, espera_min):")
     for c in top_espera:
-        print(f"{c.id}, {c.nome}, {c.espera():.2f}")
+        print(f"{c.id}, {c.nome}, {c.espera_val:.2f}")
 
     # opção para desfazer último atendimento (se registrar_undo)
     if registrar_undo and undo_stack: